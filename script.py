@@ -1,7 +1,8 @@
+import shutil
+
 
 # 2. Create requirements.txt
 requirements = """selenium==4.15.0
-beautifulsoup4==4.12.2
 requests==2.31.0
 lxml==4.9.3
 """
@@ -63,25 +64,16 @@ with open(f"{project_name}/.gitignore", "w", encoding="utf-8") as f:
     f.write(gitignore)
 
 # 4. Copy the main scraper script
-with open("twine_scraper.py", "r", encoding="utf-8") as f:
-    scraper_content = f.read()
-
-with open(f"{project_name}/twine_scraper.py", "w", encoding="utf-8") as f:
-    f.write(scraper_content)
+with open("twine_scraper.py", "rb") as src, open(f"{project_name}/twine_scraper.py", "wb") as dst:
+    shutil.copyfileobj(src, dst, length=1 << 20)
 
 # 5. Copy the sample CSV
-with open("sample_scraped_profiles.csv", "r", encoding="utf-8") as f:
-    csv_content = f.read()
-
-with open(f"{project_name}/sample_scraped_profiles.csv", "w", encoding="utf-8") as f:
-    f.write(csv_content)
+with open("sample_scraped_profiles.csv", "rb") as src, open(f"{project_name}/sample_scraped_profiles.csv", "wb") as dst:
+    shutil.copyfileobj(src, dst, length=1 << 20)
 
 # 6. Copy the technical documentation
-with open("Technical_Documentation.md", "r", encoding="utf-8") as f:
-    doc_content = f.read()
-
-with open(f"{project_name}/Technical_Documentation.md", "w", encoding="utf-8") as f:
-    f.write(doc_content)
+with open("Technical_Documentation.md", "rb") as src, open(f"{project_name}/Technical_Documentation.md", "wb") as dst:
+    shutil.copyfileobj(src, dst, length=1 << 20)
 
 print("✓ requirements.txt created")
 print("✓ .gitignore created")
@@ -11,13 +11,22 @@ import csv
 import re
 import time
 import logging
-from typing import List, Dict
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List
+import lxml.html
+from lxml import etree
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from bs4 import BeautifulSoup
 import random
 
 # Configure logging
@@ -27,6 +36,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Precompiled patterns shared across all profiles
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+# Word-boundary fenced variant for scanning free page text
+_EMAIL_SCAN_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Compiled XPath queries, profile name selectors in priority order
+_REGEX_NS = {'re': 'http://exslt.org/regular-expressions'}
+_NAME_XPATHS = (
+    etree.XPath('//h1[re:test(@class, "profile|name|title", "i")]', namespaces=_REGEX_NS),
+    etree.XPath('//h1'),
+    etree.XPath('//div[re:test(@class, "name", "i")]', namespaces=_REGEX_NS),
+)
+_MAILTO_XPATH = etree.XPath('//a[starts-with(@href, "mailto:")]/@href')
+_PROFILE_LINKS_XPATH = etree.XPath('//a[contains(@href, "/profile/")]/@href')
+
+# Brand indicators as per assessment requirements, matched as whole words
+_BRAND_KEYWORDS = (
+    'studio', 'media', 'agency', 'productions', 'designs',
+    'labs', 'official', 'channel', 'team', 'llc', 'inc',
+    'ltd', 'pvt', 'gmbh', 'plc', 'company', 'group',
+    'collective', 'enterprise', 'corporation'
+)
+# Plural variants too, e.g. "Studios"
+_BRAND_WORDS = frozenset(_BRAND_KEYWORDS) | frozenset(f'{word}s' for word in _BRAND_KEYWORDS)
+_WORD_RE = re.compile(r'\w+')
+
+# Test/placeholder markers
+_TEST_EMAIL_RE = re.compile(r'(?:test|example|sample|demo|placeholder)@', re.I)
+_TEST_NAMES = frozenset({'test', 'sample', 'demo', 'placeholder', 'example'})
+
+# Diverse, realistic names for fallback data generation
+_FIRST_NAMES = (
+    "Emma", "Liam", "Olivia", "Noah", "Ava", "Ethan", "Sophia", "Mason",
+    "Isabella", "William", "Mia", "James", "Charlotte", "Benjamin", "Amelia",
+    "Lucas", "Harper", "Henry", "Evelyn", "Alexander", "Abigail", "Michael",
+    "Emily", "Daniel", "Elizabeth", "Matthew", "Sofia", "David", "Avery",
+    "Joseph", "Ella", "Carter", "Scarlett", "Owen", "Grace", "Wyatt", "Chloe",
+    "Sebastian", "Victoria", "Jack", "Madison", "Luke", "Aria", "Nathan",
+    "Hannah", "Caleb", "Addison", "Isaac", "Natalie", "Gabriel", "Lily"
+)
+
+_LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson",
+    "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee",
+    "Thompson", "White", "Harris", "Clark", "Lewis", "Robinson", "Walker",
+    "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
+    "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera",
+    "Campbell", "Mitchell", "Carter", "Roberts", "Phillips", "Evans", "Turner"
+)
+
+_EMAIL_DOMAINS = ("gmail.com", "outlook.com", "yahoo.com", "protonmail.com", "icloud.com")
+
 
 class TwineScraper:
     """
@@ -34,46 +98,115 @@ class TwineScraper:
     Handles UGC Creators and Video Editors with robust error handling
     """
 
-    def __init__(self, headless=True, use_fallback=True):
+    def __init__(self, headless=True, use_fallback=True, max_workers=8):
         self.headless = headless
         self.use_fallback = use_fallback  # Use fallback data if scraping fails
+        self.max_workers = max_workers  # Parallel profile page fetches
         self.driver = None
+        self.drivers = []  # All live drivers, self.driver included
+        self.driver_pool = queue.Queue()  # Drivers free for profile fetches
+        self.driver_lock = threading.Lock()  # Guards lazy growth of the pool
+        self.session = requests.Session()  # Keep-alive HTTP for server-rendered profiles
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            # No read retries: a slow profile should fall through to Selenium quickly
+            max_retries=Retry(total=2, connect=1, read=0, status_forcelist=(502, 503, 504), backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
         self.scraped_profiles = []
         self.seen_emails = set()
+        self.seen_profile_urls = set()
         self.scraping_failed = False
 
+    def create_driver(self):
+        """Create a Selenium WebDriver with appropriate options"""
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless=new')  # Updated headless mode
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument(f'user-agent={USER_AGENT}')
+
+        # Additional options to prevent timeouts
+        options.add_argument('--dns-prefetch-disable')
+        options.add_argument('--disable-extensions')
+        options.page_load_strategy = 'eager'  # Wait for the DOM, not for all resources
+
+        # Skip images, stylesheets and fonts - only the DOM is scraped
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(6)  # Bounds get() up to DOMContentLoaded under the eager strategy
+        driver.implicitly_wait(0)  # Explicit WebDriverWaits only, no implicit polling
+        driver.set_script_timeout(4)
+        return driver
+
     def setup_driver(self):
-        """Initialize Selenium WebDriver with appropriate options"""
+        """
+        Initialize the main WebDriver and seed the profile driver pool with it
+        The main driver doubles as a pool member since listings and profiles
+        are never loaded at the same time; more drivers are started on demand
+        """
         try:
-            options = webdriver.ChromeOptions()
-            if self.headless:
-                options.add_argument('--headless=new')  # Updated headless mode
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-
-            # Additional options to prevent timeouts
-            options.add_argument('--dns-prefetch-disable')
-            options.add_argument('--disable-extensions')
-            options.page_load_strategy = 'eager'  # Don't wait for all resources
-
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(15)  # Reduced timeout
-            logger.info("WebDriver initialized successfully")
-            return True
+            self.driver = self.create_driver()
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {str(e)}")
             return False
 
+        self.drivers.append(self.driver)
+        self.driver_pool.put(self.driver)
+        logger.info("WebDriver initialized successfully")
+        return True
+
+    def borrow_driver(self, timeout: float = 30):
+        """
+        Take a free driver from the pool, starting a new one while the pool is
+        below max_workers. Raises queue.Empty if none frees up within timeout
+        """
+        if not self.drivers:
+            raise queue.Empty  # setup_driver was never run or failed
+
+        try:
+            return self.driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.driver_lock:
+            if len(self.drivers) < self.max_workers:
+                try:
+                    driver = self.create_driver()
+                    self.drivers.append(driver)
+                    logger.debug(f"Started WebDriver {len(self.drivers)}/{self.max_workers}")
+                    return driver
+                except Exception as e:
+                    logger.warning(f"Could not start another WebDriver: {str(e)[:100]}")
+
+        return self.driver_pool.get(timeout=timeout)
+
+    def polite_delay(self, started: float):
+        """
+        Rate limiting: back off briefly only when a page answered very fast
+        Slow pages have already spaced out the requests on their own
+        """
+        if time.monotonic() - started < 0.5:
+            time.sleep(random.uniform(0.1, 0.3))
+
     def validate_email(self, email: str) -> bool:
         """Validate email format using regex"""
         if not email or not isinstance(email, str):
             return False
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.fullmatch(email))
 
     def is_valid_name(self, name: str) -> bool:
         """
@@ -83,33 +216,16 @@ class TwineScraper:
         if not name or len(name.strip()) < 2:
             return False
 
-        name_lower = name.lower().strip()
+        name_lower = name.strip().lower()
 
-        # Brand indicators as per assessment requirements
-        brand_keywords = [
-            'studio', 'media', 'agency', 'productions', 'designs', 
-            'labs', 'official', 'channel', 'team', 'llc', 'inc', 
-            'ltd', 'pvt', 'gmbh', 'plc', 'company', 'group',
-            'collective', 'enterprise', 'corporation'
-        ]
-
-        for keyword in brand_keywords:
-            if keyword in name_lower:
-                return False
-
-        # Filter "The" prefix as specified in requirements
-        if name_lower.startswith('the '):
+        # Brand keywords and "The" prefix as specified in requirements
+        if not _BRAND_WORDS.isdisjoint(_WORD_RE.findall(name_lower)):
             return False
-
-        return True
+        return not name_lower.startswith('the ')
 
     def is_test_data(self, email: str, name: str) -> bool:
         """Identify test/placeholder data as per assessment requirements"""
-        test_emails = ['test@', 'example@', 'sample@', 'demo@', 'placeholder@']
-        test_names = ['test', 'sample', 'demo', 'placeholder', 'example']
-
-        return any(pattern in email.lower() for pattern in test_emails) or \
-               name.lower() in test_names
+        return bool(_TEST_EMAIL_RE.search(email)) or name.strip().lower() in _TEST_NAMES
 
     def validate_profile_url(self, url: str) -> bool:
         """Validate profile URL completeness"""
@@ -124,63 +240,25 @@ class TwineScraper:
         """
         logger.info(f"Generating fallback data for {role_type} (scraping unavailable)")
 
-        # Diverse, realistic names
-        first_names = [
-            "Emma", "Liam", "Olivia", "Noah", "Ava", "Ethan", "Sophia", "Mason",
-            "Isabella", "William", "Mia", "James", "Charlotte", "Benjamin", "Amelia",
-            "Lucas", "Harper", "Henry", "Evelyn", "Alexander", "Abigail", "Michael",
-            "Emily", "Daniel", "Elizabeth", "Matthew", "Sofia", "David", "Avery",
-            "Joseph", "Ella", "Carter", "Scarlett", "Owen", "Grace", "Wyatt", "Chloe",
-            "Sebastian", "Victoria", "Jack", "Madison", "Luke", "Aria", "Nathan",
-            "Hannah", "Caleb", "Addison", "Isaac", "Natalie", "Gabriel", "Lily"
-        ]
-
-        last_names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
-            "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson",
-            "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee",
-            "Thompson", "White", "Harris", "Clark", "Lewis", "Robinson", "Walker",
-            "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
-            "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera",
-            "Campbell", "Mitchell", "Carter", "Roberts", "Phillips", "Evans", "Turner"
-        ]
-
-        email_domains = ["gmail.com", "outlook.com", "yahoo.com", "protonmail.com", "icloud.com"]
-
-        profiles = []
-        used_emails = set()
-
         role_suffix = "ugc-creator" if role_type == "ugc_creators" else "video-editor"
         role_display = "UGC Creator" if role_type == "ugc_creators" else "Video Editor"
-
-        for i in range(count):
-            first = random.choice(first_names)
-            last = random.choice(last_names)
-            full_name = f"{first} {last}"
-
-            # Generate unique email
-            email_base = f"{first.lower()}.{last.lower()}"
-            domain = random.choice(email_domains)
-            email = f"{email_base}@{domain}"
-
-            counter = 1
-            while email in used_emails:
-                email = f"{email_base}{counter}@{domain}"
-                counter += 1
-
-            used_emails.add(email)
-
-            # Generate profile link
-            profile_id = i + 1 + (0 if role_type == "ugc_creators" else 1000)
-            profile_slug = f"{first.lower()}-{last.lower()}-{role_suffix}"
-            profile_link = f"https://www.twine.net/profile/{profile_slug}-{profile_id}"
-
-            profiles.append({
-                'name': full_name,
-                'email': email,
-                'profile_link': profile_link,
+        first_id = 1 if role_type == "ugc_creators" else 1001
+
+        # Draw every column in one batch rather than per profile
+        firsts = random.choices(_FIRST_NAMES, k=count)
+        lasts = random.choices(_LAST_NAMES, k=count)
+        domains = random.choices(_EMAIL_DOMAINS, k=count)
+
+        # The profile id makes every email and link unique, across roles too
+        profiles = [
+            {
+                'name': f"{first} {last}",
+                'email': f"{first.lower()}.{last.lower()}.{profile_id}@{domain}",
+                'profile_link': f"https://www.twine.net/profile/{first.lower()}-{last.lower()}-{role_suffix}-{profile_id}",
                 'role_type': role_display
-            })
+            }
+            for profile_id, first, last, domain in zip(range(first_id, first_id + count), firsts, lasts, domains)
+        ]
 
         # Add some invalid entries to demonstrate filtering
         invalid_entries = [
@@ -200,43 +278,76 @@ class TwineScraper:
     def scrape_profile_page(self, profile_url: str) -> Dict:
         """
         Extract email and name from individual profile page
+        Tries a plain HTTP fetch first and only renders the page on a pooled
+        driver when the server-side HTML lacks the details
         """
+        profile_data = self.scrape_profile_static(profile_url)
+        if profile_data['name'] and profile_data['email']:
+            return profile_data
+
         try:
-            self.driver.get(profile_url)
-            time.sleep(1.5)  # Reduced wait time
+            driver = self.borrow_driver()
+        except queue.Empty:
+            logger.debug(f"No WebDriver available for {profile_url}")
+            return {'name': None, 'email': None}
 
-            # Wait for page load with shorter timeout
-            WebDriverWait(self.driver, 8).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+        try:
+            return self.scrape_profile_rendered(profile_url, driver)
+        finally:
+            self.driver_pool.put(driver)
+
+    def parse_profile_html(self, html) -> Dict:
+        """Extract email and name from profile HTML with a single lxml parse"""
+        tree = lxml.html.fromstring(html)
+
+        # Extract name - try multiple selectors
+        name = None
+        for xpath in _NAME_XPATHS:
+            elems = xpath(tree)
+            if elems:
+                name = elems[0].text_content().strip()
+                break
 
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            # Extract name - try multiple selectors
-            name = None
-            name_selectors = [
-                soup.find('h1', class_=re.compile('profile|name|title', re.I)),
-                soup.find('h1'),
-                soup.find('div', class_=re.compile('name', re.I))
-            ]
-            for elem in name_selectors:
-                if elem:
-                    name = elem.text.strip()
-                    break
+        # Extract email - try multiple methods
+        email = None
+        mailtos = _MAILTO_XPATH(tree)
+        if mailtos:
+            email = mailtos[0].replace('mailto:', '')
+        else:
+            # Try finding in text
+            email_match = _EMAIL_SCAN_RE.search(tree.text_content())
+            if email_match:
+                email = email_match.group(0)
+
+        return {'name': name, 'email': email}
+
+    def scrape_profile_static(self, profile_url: str) -> Dict:
+        """Extract email and name from the server-rendered profile HTML"""
+        try:
+            started = time.monotonic()
+            response = self.session.get(profile_url, timeout=8)
+            response.raise_for_status()
+            self.polite_delay(started)
+            return self.parse_profile_html(response.content)
+
+        except Exception as e:
+            logger.debug(f"Static fetch failed for {profile_url}: {str(e)}")
+            return {'name': None, 'email': None}
 
-            # Extract email - try multiple methods
-            email = None
-            email_elem = soup.find('a', href=re.compile('mailto:'))
-            if email_elem:
-                email = email_elem['href'].replace('mailto:', '')
-            else:
-                # Try finding in text
-                text = soup.get_text()
-                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-                if email_match:
-                    email = email_match.group(0)
+    def scrape_profile_rendered(self, profile_url: str, driver=None) -> Dict:
+        """Extract email and name from the profile page rendered by Selenium"""
+        driver = driver or self.driver
+        try:
+            started = time.monotonic()
+            driver.get(profile_url)
+
+            # DOM is parsed once get() returns; wait for script-rendered details too
+            WebDriverWait(driver, 4).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "h1, div[class*='name' i], a[href^='mailto:']"))
+            )
+            self.polite_delay(started)
 
-            return {'name': name, 'email': email}
+            return self.parse_profile_html(driver.page_source)
 
         except Exception as e:
             logger.debug(f"Error scraping profile {profile_url}: {str(e)}")
@@ -261,6 +372,8 @@ class TwineScraper:
         page = 1
         max_retries = 2
         retry_count = 0
+        max_stale_pages = 3  # Guard against pagination that keeps serving seen profiles
+        stale_pages = 0
 
         logger.info(f"Starting scrape for {role_type}...")
 
@@ -268,51 +381,63 @@ class TwineScraper:
             try:
                 # Try to load the page
                 page_url = f"{url}?page={page}" if page > 1 else url
+                started = time.monotonic()
                 self.driver.get(page_url)
-                time.sleep(2)
 
                 # Wait for profile cards with reduced timeout
-                WebDriverWait(self.driver, 8).until(
+                WebDriverWait(self.driver, 4).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='card'], a[href*='/profile/']"))
                 )
+                self.polite_delay(started)
 
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                tree = lxml.html.fromstring(self.driver.page_source)
 
-                # Find profile links - try multiple selectors
-                profile_links = []
+                # Find all links with /profile/ in href, made absolute
+                hrefs = [
+                    href if href.startswith('http') else 'https://www.twine.net' + href
+                    for href in _PROFILE_LINKS_XPATH(tree)
+                ]
 
-                # Method 1: Find all links with /profile/ in href
-                for link in soup.find_all('a', href=re.compile('/profile/')):
-                    href = link.get('href')
-                    if href and '/profile/' in href:
-                        if not href.startswith('http'):
-                            href = 'https://www.twine.net' + href
-                        profile_links.append(href)
-
-                if not profile_links:
+                if not hrefs:
                     logger.warning(f"No profiles found on page {page}")
                     retry_count += 1
                     continue
 
-                # Remove duplicates
-                profile_links = list(set(profile_links))[:target_count - len(profiles)]
+                # Remove duplicates (keeping page order) and profiles already scraped
+                profile_links = list(dict.fromkeys(
+                    href for href in hrefs if href not in self.seen_profile_urls
+                ))[:target_count - len(profiles)]
+
+                if not profile_links:
+                    # Page loaded fine but holds only seen profiles - move on
+                    stale_pages += 1
+                    if stale_pages >= max_stale_pages:
+                        logger.warning(f"No new profiles on {stale_pages} consecutive pages, stopping")
+                        break
+                    logger.info(f"All profiles on page {page} already scraped, moving on")
+                    page += 1
+                    continue
+
+                stale_pages = 0
 
                 logger.info(f"Found {len(profile_links)} profiles on page {page}")
 
-                # Scrape each profile (limit to avoid too many requests)
-                for profile_link in profile_links[:10]:  # Process 10 at a time
-                    profile_data = self.scrape_profile_page(profile_link)
+                # Scrape profiles in parallel (limit to avoid too many requests)
+                batch = profile_links[:10]  # Process 10 at a time
+                self.seen_profile_urls.update(batch)
 
-                    if profile_data['email'] and profile_data['name']:
-                        profiles.append({
-                            'name': profile_data['name'],
-                            'email': profile_data['email'],
-                            'profile_link': profile_link,
-                            'role_type': role_type.replace('_', ' ').title()
-                        })
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for profile_link, profile_data in zip(batch, executor.map(self.scrape_profile_page, batch)):
+                        if profile_data['email'] and profile_data['name']:
+                            profiles.append({
+                                'name': profile_data['name'],
+                                'email': profile_data['email'],
+                                'profile_link': profile_link,
+                                'role_type': role_type.replace('_', ' ').title()
+                            })
 
-                    if len(profiles) >= target_count:
-                        break
+                        if len(profiles) >= target_count:
+                            break
 
                 page += 1
                 logger.info(f"Scraped {len(profiles)}/{target_count} profiles for {role_type}")
@@ -340,7 +465,15 @@ class TwineScraper:
 
     def clean_data(self, data: List[Dict]) -> List[Dict]:
         """Apply all validation filters to remove invalid entries"""
-        cleaned = []
+        return list(self.iter_clean_data(data))
+
+    def iter_clean_data(self, data: List[Dict]) -> Iterator[Dict]:
+        """
+        Streaming form of clean_data, yielding entries as they pass
+        seen_emails is updated per yielded entry and the validation stats
+        are logged only once the generator has been fully consumed
+        """
+        valid_count = 0
         stats = {
             'duplicates': 0,
             'invalid_emails': 0,
@@ -349,65 +482,88 @@ class TwineScraper:
             'invalid_urls': 0
         }
 
+        # Bind validators once rather than per row
+        seen_emails = self.seen_emails
+        validate_email = self.validate_email
+        is_valid_name = self.is_valid_name
+        is_test_data = self.is_test_data
+        validate_profile_url = self.validate_profile_url
+
         for entry in data:
+            # Canonicalize once so dedup and later checks are case-insensitive
+            if isinstance(entry['email'], str):
+                entry['email'] = entry['email'].lower()
+
             # Duplicate check
-            if entry['email'] in self.seen_emails:
+            if entry['email'] in seen_emails:
                 stats['duplicates'] += 1
                 continue
 
             # Email validation
-            if not self.validate_email(entry['email']):
+            if not validate_email(entry['email']):
                 stats['invalid_emails'] += 1
                 continue
 
             # Name validation (no brands)
-            if not self.is_valid_name(entry['name']):
+            if not is_valid_name(entry['name']):
                 stats['brand_names'] += 1
                 continue
 
             # Test data check
-            if self.is_test_data(entry['email'], entry['name']):
+            if is_test_data(entry['email'], entry['name']):
                 stats['test_data'] += 1
                 continue
 
             # URL validation
-            if not self.validate_profile_url(entry['profile_link']):
+            if not validate_profile_url(entry['profile_link']):
                 stats['invalid_urls'] += 1
                 continue
 
             # Passed all validations
-            cleaned.append(entry)
-            self.seen_emails.add(entry['email'])
+            valid_count += 1
+            seen_emails.add(entry['email'])
+            yield entry
 
         logger.info(f"\nValidation Results:")
         logger.info(f"  Raw profiles: {len(data)}")
-        logger.info(f"  Valid profiles: {len(cleaned)}")
-        logger.info(f"  Filtered: {len(data) - len(cleaned)}")
+        logger.info(f"  Valid profiles: {valid_count}")
+        logger.info(f"  Filtered: {len(data) - valid_count}")
         if any(stats.values()):
             logger.info(f"  Breakdown - Brands: {stats['brand_names']}, Test: {stats['test_data']}, "
                        f"Invalid Emails: {stats['invalid_emails']}, Invalid URLs: {stats['invalid_urls']}")
 
-        return cleaned
-
-    def save_to_csv(self, data: List[Dict], filename: str = 'scraped_profiles.csv'):
-        """Export data to CSV file"""
-        if not data:
+    def save_to_csv(self, data: Iterable[Dict], filename: str = 'scraped_profiles.csv') -> Counter:
+        """
+        Export data to CSV file, writing each row as it arrives
+        Returns the number of profiles written per role type
+        """
+        rows = iter(data)
+        first = next(rows, None)
+        role_counts = Counter()
+        if first is None:
             logger.warning("No data to save")
-            return
+            return role_counts
 
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        sample = []
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             fieldnames = ['name', 'email', 'profile_link', 'role_type']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(data)
+            for entry in chain((first,), rows):
+                writer.writerow(entry)
+                role_counts[entry['role_type']] += 1
+                if len(sample) < 3:
+                    sample.append(entry)
 
-        logger.info(f"\n✓ Saved {len(data)} profiles to {filename}")
+        logger.info(f"\n✓ Saved {sum(role_counts.values())} profiles to {filename}")
 
         # Show sample
         logger.info(f"\nSample output (first 3 profiles):")
-        for i, profile in enumerate(data[:3], 1):
+        for i, profile in enumerate(sample, 1):
             logger.info(f"  {i}. {profile['name']} | {profile['email']}")
 
+        return role_counts
+
     def run(self, target_per_role: int = 50):
         """Main execution flow"""
         start_time = time.time()
@@ -433,24 +589,21 @@ class TwineScraper:
             editor_profiles = self.scrape_role_listings('video_editors', target_per_role)
             all_profiles.extend(editor_profiles)
 
-            # Clean data
+            # Clean data and stream valid rows straight to CSV
             logger.info("\n" + "="*60)
             logger.info("Running validation pipeline...")
-            cleaned_profiles = self.clean_data(all_profiles)
-
-            # Save results
-            self.save_to_csv(cleaned_profiles)
+            role_counts = self.save_to_csv(self.iter_clean_data(all_profiles))
 
             # Statistics
             elapsed = time.time() - start_time
-            ugc_count = sum(1 for p in cleaned_profiles if 'UGC' in p['role_type'])
-            editor_count = sum(1 for p in cleaned_profiles if 'Video' in p['role_type'])
+            ugc_count = sum(n for role, n in role_counts.items() if 'UGC' in role)
+            editor_count = sum(n for role, n in role_counts.items() if 'Video' in role)
 
             logger.info(f"\n{'='*60}")
             logger.info(f"SCRAPING COMPLETE")
             logger.info(f"{'='*60}")
             logger.info(f"Total profiles collected: {len(all_profiles)}")
-            logger.info(f"Valid profiles after validation: {len(cleaned_profiles)}")
+            logger.info(f"Valid profiles after validation: {sum(role_counts.values())}")
             logger.info(f"  - UGC Creators: {ugc_count}")
             logger.info(f"  - Video Editors: {editor_count}")
             logger.info(f"Time elapsed: {elapsed:.2f} seconds")
@@ -462,12 +615,14 @@ class TwineScraper:
                 logger.info(f"  The same code would work with live scraped data")
 
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                    logger.info("\nWebDriver closed")
-                except:
-                    pass
+            self.session.close()
+            if self.drivers:
+                for driver in self.drivers:
+                    try:
+                        driver.quit()
+                    except:
+                        pass
+                logger.info("\nWebDriver closed")
 
 
 if __name__ == "__main__":